@@ -50,7 +50,9 @@ class RADTBenchmark:
         Context manager for a run.
         Will track ML operations while active.
         """
-        if "RADT_MAX_EPOCH" not in os.environ:
+        # Looked up once, checked on every attribute access
+        self._enabled = "RADT_MAX_EPOCH" in os.environ
+        if not self._enabled:
             return
 
         try:
@@ -92,13 +94,13 @@ class RADTBenchmark:
         except AttributeError:
             att = getattr(mlflow, name)
 
-        if "RADT_MAX_EPOCH" not in os.environ:
+        if not super().__getattribute__("_enabled"):
             if isinstance(att, types.MethodType) or isinstance(att, types.FunctionType):
                 return dummy
         return att
 
     def __enter__(self):
-        if "RADT_MAX_EPOCH" not in os.environ:
+        if not self._enabled:
             return self
 
         self.threads = []
@@ -128,16 +130,21 @@ class RADTBenchmark:
         for thread in self.threads:
             thread.start()
 
-        from carbontracker.tracker import CarbonTracker
-        self.carbon_tracker = CarbonTracker(epochs=self.max_epoch)
-        print(f"Initializing CarbonTracker with epochs: {self.max_epoch}")
-        self.carbon_tracker.epoch_start()
+        # Imported here so the scheduler does not load carbontracker on startup
+        try:
+            from carbontracker.tracker import CarbonTracker
+        except ImportError as e:
+            print(f"CarbonTracker unavailable, continuing without it ({e})")
+        else:
+            self.carbon_tracker = CarbonTracker(epochs=self.max_epoch)
+            print(f"Initializing CarbonTracker with epochs: {self.max_epoch}")
+            self.carbon_tracker.epoch_start()
 
         return self
 
     def __exit__(self, type, value, traceback):
         # Terminate listeners and run
-        if "RADT_MAX_EPOCH" not in os.environ:
+        if not self._enabled:
             return
         for thread in self.threads:
             thread.terminate()
@@ -159,7 +166,7 @@ class RADTBenchmark:
         :param epoch: Integer training step (epoch) at which was the metric calculated.
                      Defaults to 0.
         """
-        if "RADT_MAX_EPOCH" not in os.environ:
+        if not self._enabled:
             return
         mlflow.log_metric(name, value, epoch)
 
@@ -178,7 +185,7 @@ class RADTBenchmark:
         :param epoch: Integer training step (epoch) at which was the metric calculated.
                      Defaults to 0.
         """
-        if "RADT_MAX_EPOCH" not in os.environ:
+        if not self._enabled:
             return
         mlflow.log_metrics(metrics, epoch)
 
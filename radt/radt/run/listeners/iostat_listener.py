@@ -26,7 +26,7 @@ class IOstatThread(Process):
             m = {}
             line = line.lstrip()
 
-            if line.startswith("nvme") or line.startswith("sd"):
+            if line.startswith(("nvme", "sd")):
                 word_vector = line.strip().split()
 
                 device = word_vector[0]  # storage device
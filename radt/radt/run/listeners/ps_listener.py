@@ -3,6 +3,8 @@ import os
 import subprocess
 import time
 
+from mlflow.entities import Metric
+from mlflow.tracking import MlflowClient
 from multiprocessing import Process
 
 
@@ -16,6 +18,7 @@ class PSThread(Process):
 
     def run(self):
         mlflow.start_run(run_id=self.run_id).__enter__()  # attach to run
+        client = MlflowClient()
 
         while True:
             output = (
@@ -27,9 +30,10 @@ class PSThread(Process):
                 .splitlines()
             )
 
-            for line in output[1:]:
-                line = line.strip().split(" ")
-                line = [x for x in line if x.strip() != ""]
+            timestamp = int(time.time() * 1000)
+            metrics = []
+            for i, line in enumerate(output[1:]):
+                line = line.split()
 
                 pid = line[0]
                 tid = line[1]
@@ -37,6 +41,13 @@ class PSThread(Process):
                 cpu = line[3]
                 mem = line[4]
 
-                mlflow.log_metric(f"PS - CPU {psr}", float(cpu))
-                mlflow.log_metric(f"PS - MEM {psr}", float(mem))
+                # Offset each thread by 1 ms so threads on the same processor
+                # reporting equal values are kept as separate points
+                ts = timestamp + i
+                metrics.append(Metric(f"PS - CPU {psr}", float(cpu), ts, 0))
+                metrics.append(Metric(f"PS - MEM {psr}", float(mem), ts, 0))
+
+            # Send all thread samples in a single request
+            if metrics:
+                client.log_batch(self.run_id, metrics=metrics)
             time.sleep(5)
@@ -40,21 +40,11 @@ class TOPThread(Process):
             m = {}
             line = line.lstrip()
 
-            if (
-                line.startswith("top")
-                or line.startswith("Tasks")
-                or line.startswith("%")
-                or line.startswith("PID")
-                or line.startswith(" ")
-            ):
+            if line.startswith(("top", "Tasks", "%", "PID", " ")):
                 pass
             else:
                 word_vector = line.strip().split()
-                if (
-                    line.startswith("KiB")
-                    or line.startswith("MiB")
-                    or line.startswith("GiB")
-                ) and len(word_vector) != 0:
+                if line.startswith(("KiB", "MiB", "GiB")) and len(word_vector) != 0:
                     if word_vector[1] == "Mem":
                         Flag = not (Flag)
 
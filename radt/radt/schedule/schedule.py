@@ -2,12 +2,14 @@ import os
 import sys
 import time
 from argparse import Namespace
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import ExitStack
 from pathlib import Path
 from queue import Empty, Queue
 from string import ascii_uppercase
 from subprocess import PIPE, STDOUT, Popen
-from threading import Thread
+from threading import Event, Thread, local
 
 import migedit
 import numpy as np
@@ -92,16 +94,18 @@ def execute_command(cmd: str, shell: bool = False, vars: dict = {}):
     return result
 
 
-def enqueue_output(out: PIPE, queue: Queue):
+def enqueue_output(out: PIPE, queue: Queue, event: Event):
     """Enqueue any output from pipe into queue
 
     Args:
         out (PIPE): Pipe to read from
         queue (Queue): Queue to write to
+        event (Event): Event to set whenever output is enqueued
     """
     try:
-        for line in iter(out.readline, b""):
+        for line in iter(out.readline, ""):
             queue.put(line)
+            event.set()
     except ValueError:
         pass
     out.close()
@@ -109,6 +113,7 @@ def enqueue_output(out: PIPE, queue: Queue):
 
 def process_output(popens, log_runs, log, run_ids):
     for colour, letter, p, q, _ in popens:
+        out = []
         while True:  # p.poll() is None:
             try:
                 l = q.get_nowait()
@@ -119,7 +124,12 @@ def process_output(popens, log_runs, log, run_ids):
             else:
                 log_runs[letter].append(l)
                 log.append(runformat(None, letter, l))
-                print(runformat(colour, letter, l), end="")
+                out.append(runformat(colour, letter, l))
+
+                # Forward in chunks so a chatty run does not hold back output
+                if len(out) >= 64:
+                    sys.stdout.write("".join(out))
+                    out = []
 
                 if run_ids[letter]:
                     continue
@@ -128,7 +138,44 @@ def process_output(popens, log_runs, log, run_ids):
                     run_ids[letter] = (
                         l.split("in run with ID '")[-1].split("'")[0].strip()
                     )
-                    print(runformat(colour, letter, f"MAPPED TO {run_ids[letter]}"))
+                    out.append(
+                        runformat(colour, letter, f"MAPPED TO {run_ids[letter]}\n")
+                    )
+
+        # Forward the rest of this run's drained output in a single write
+        if out:
+            sys.stdout.write("".join(out))
+
+
+# MlflowClient for each upload thread, clients are not shared across threads
+_upload_thread = local()
+
+
+def init_upload_client():
+    """Create the MlflowClient of the current upload thread"""
+    _upload_thread.client = MlflowClient()
+
+
+def upload_text(run_id: str, text: str, artifact_file: str):
+    """Upload text to a run using the upload thread's client
+
+    Args:
+        run_id (str): Run to attach the text to
+        text (str): Text to upload
+        artifact_file (str): Artifact path to store the text at
+    """
+    _upload_thread.client.log_text(run_id, text, artifact_file)
+
+
+def upload_artifact(run_id: str, file: Path):
+    """Upload a file to a run using the upload thread's client and remove the local copy
+
+    Args:
+        run_id (str): Run to attach the file to
+        file (Path): File to upload
+    """
+    _upload_thread.client.log_artifact(run_id, str(file))
+    file.unlink()
 
 
 def execute_workload(cmds: list, timeout: float):
@@ -148,6 +195,8 @@ def execute_workload(cmds: list, timeout: float):
     log_runs = {}
     popens = []
     returncodes = {}
+    output_event = Event()
+    client = MlflowClient()
 
     start_time = time.time()
 
@@ -192,7 +241,7 @@ def execute_workload(cmds: list, timeout: float):
                 )
 
                 q = Queue()
-                t = Thread(target=enqueue_output, args=(p.stdout, q))
+                t = Thread(target=enqueue_output, args=(p.stdout, q, output_event))
                 t.daemon = True
                 t.start()
 
@@ -207,14 +256,14 @@ def execute_workload(cmds: list, timeout: float):
                     letter
                 ] == False:
                     process_output(popens, log_runs, log, run_ids)
-                    time.sleep(2)
+                    output_event.wait(timeout=2)
+                    output_event.clear()
 
             # Group runs into workload children
             # And add experiment/workload to name
             parent_id = ""
             for _, _, letter, _, _, _, filepath, _ in cmds:
                 if run_id := run_ids[letter]:
-                    client = MlflowClient()
                     if run := client.get_run(run_id):
                         client.set_tag(
                             run_id,
@@ -229,8 +278,7 @@ def execute_workload(cmds: list, timeout: float):
 
             # Remove run blockers to start synchronised runs
             for _, _, _, _, _, _, filepath, _ in cmds:
-                if (Path(filepath) / "radtlock").is_file():
-                    (Path(filepath) / "radtlock").unlink()
+                (Path(filepath) / "radtlock").unlink(missing_ok=True)
 
             while True:
 
@@ -246,6 +294,9 @@ def execute_workload(cmds: list, timeout: float):
                 else:
                     break
 
+                # Sleep until any run produces output, rechecking run status every second
+                output_event.wait(timeout=1)
+                output_event.clear()
                 process_output(popens, log_runs, log, run_ids)
 
         except KeyboardInterrupt:
@@ -276,33 +327,64 @@ def execute_workload(cmds: list, timeout: float):
 
     sysprint("Sending logs to server.")
     results = []
+    workload_log = "".join(log)
 
-    for id, _, letter, _, _, _, filepath, row in cmds:
-        if run_id := run_ids[letter]:
-            client = MlflowClient()
-            if run := client.get_run(run_id):
-                results.append(
-                    (
-                        id,
-                        letter,
-                        returncodes[letter],
-                        run_id,
-                        run.info.run_name,
-                        run.info.status,
+    # Overlap uploads across runs, the workload listener reports can be large
+    executor = ThreadPoolExecutor(max_workers=4, initializer=init_upload_client)
+    try:
+        uploads = []
+        reports = set()
+        for id, _, letter, _, _, _, filepath, row in cmds:
+            if run_id := run_ids[letter]:
+                if run := client.get_run(run_id):
+                    results.append(
+                        (
+                            id,
+                            letter,
+                            returncodes[letter],
+                            run_id,
+                            run.info.run_name,
+                            run.info.status,
+                        )
                     )
-                )
-                client.log_text(run_id, "".join(log_runs[letter]), f"log_{run_id}.txt")
-                client.log_text(run_id, "".join(log), f"log_workload.txt")
-
-                if row["WorkloadListener"]:
-                    try:
-                        for file in Path(filepath).glob(
-                            f"{row['WorkloadListener'].split('-o ')[1].split()[0]}*.*-rep"
-                        ):
-                            client.log_artifact(run_id, str(file))
-                            file.unlink()
-                    except IndexError:
-                        pass
+                    uploads.append(
+                        executor.submit(
+                            upload_text,
+                            run_id,
+                            "".join(log_runs[letter]),
+                            f"log_{run_id}.txt",
+                        )
+                    )
+                    uploads.append(
+                        executor.submit(
+                            upload_text, run_id, workload_log, f"log_workload.txt"
+                        )
+                    )
+
+                    if row["WorkloadListener"]:
+                        try:
+                            for file in Path(filepath).glob(
+                                f"{row['WorkloadListener'].split('-o ')[1].split()[0]}*.*-rep"
+                            ):
+                                # Prefixes may overlap (device 1 and 10), the first
+                                # matching run claims the report like it did before
+                                if file in reports:
+                                    continue
+                                reports.add(file)
+                                uploads.append(
+                                    executor.submit(upload_artifact, run_id, file)
+                                )
+                        except IndexError:
+                            pass
+
+        # Raise any errors that occurred during upload
+        for upload in uploads:
+            upload.result()
+    except BaseException:
+        # Drop queued uploads on errors and KeyboardInterrupt
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
 
     if terminate:
         sys.exit()
@@ -310,17 +392,25 @@ def execute_workload(cmds: list, timeout: float):
     return results
 
 
+# GPU UUIDs are not altered by MIG changes, reuse them once found
+_GPU_IDS = {}
+
+
 def get_gpu_ids():
-    """Get UUIDs of all gpus
+    """Get UUIDs of all gpus. Cached once nvidia-smi reports any GPUs
 
     Returns:
         dict: GPU indices and UUIDs
     """
+    if _GPU_IDS:
+        return _GPU_IDS
+
     gpus = {}
     for line in execute_command("nvidia-smi -L"):
         if "UUID: GPU" in line:
             gpu = line.split("GPU")[1].split(":")[0].strip()
             gpus[gpu] = line.split("UUID:")[1].split(")")[0].strip()
+    _GPU_IDS.update(gpus)
     return gpus
 
 
@@ -505,15 +595,13 @@ def start_schedule(parsed_args: Namespace, file: Path, args_passthrough: list):
             sysprint(f"SKIPPING Workload: {workload}")
             continue
 
-        assigned = []
+        # Number runs sharing devices A, B, ... in order of appearance
+        letter_counts = Counter()
         for i, row in df_workload.iterrows():
-            if row["Devices"] not in assigned:
-                assigned.append(row["Devices"])
             letter = row["Devices"]
             df_workload.loc[i, "Letter"] = letter
-            df_workload.loc[i, "Number"] = ascii_uppercase[
-                (df_workload["Letter"].value_counts()[letter] - 1)
-            ]
+            df_workload.loc[i, "Number"] = ascii_uppercase[letter_counts[letter]]
+            letter_counts[letter] += 1
 
         letter_quants = df_workload["Letter"].value_counts()
         for i, row in df_workload.iterrows():